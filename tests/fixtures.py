@@ -3,7 +3,7 @@ import json
 from typing import List
 
 import pytest
-from tgfp_nfl import TgfpNfl
+from tgfp_nfl import TgfpNfl, TgfpNflRateLimiter
 
 
 @pytest.fixture
@@ -20,7 +20,7 @@ def tgfp_nfl_obj() -> TgfpNfl:
         games_data: dict = json.load(game_json_data)
     with open('data/nfl_standings_data.json', 'r', encoding='utf-8') as standing_json_data:
         standings_data: dict = json.load(standing_json_data)
-    patched_tgfp = TgfpNfl(week_no=1)
+    patched_tgfp = TgfpNfl(week_no=1, rate_limiter=TgfpNflRateLimiter(rate=1e6, burst=1000))
     patched_tgfp._games_source_data = games_data['events']
     patched_tgfp._teams_source_data = teams_data['sports'][0]['leagues'][0]['teams']
     afc_standings: List = standings_data['children'][0]['standings']['entries']
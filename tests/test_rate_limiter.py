@@ -0,0 +1,134 @@
+import threading
+import time
+from typing import List
+
+import httpx
+
+from tgfp_nfl import (TgfpNflRateLimiter,
+                      PRIORITY_INTERACTIVE,
+                      PRIORITY_BACKGROUND)
+
+HOST = 'site.api.espn.com'
+URL = f'https://{HOST}/apis/site/v2/sports/football/nfl/teams'
+
+
+def test_burst_then_paced():
+    limiter = TgfpNflRateLimiter(rate=20.0, burst=3)
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.acquire(HOST)
+    assert time.monotonic() - start < 0.05
+    limiter.acquire(HOST)
+    assert time.monotonic() - start >= 0.04
+
+
+def test_host_limits_are_separate():
+    limiter = TgfpNflRateLimiter(rate=0.1, burst=1,
+                                 host_limits={'sports.core.api.espn.com': (100.0, 5)})
+    limiter.acquire(HOST)
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire('sports.core.api.espn.com')
+    assert time.monotonic() - start < 0.05
+
+
+def test_interactive_served_before_background():
+    limiter = TgfpNflRateLimiter(rate=50.0, burst=1)
+    limiter.acquire(HOST)
+    limiter.block_host(HOST, 0.3)
+    served: List[str] = []
+
+    def request(name: str, priority: int):
+        limiter.acquire(HOST, priority)
+        served.append(name)
+
+    background = threading.Thread(target=request, args=('background', PRIORITY_BACKGROUND))
+    background.start()
+    time.sleep(0.05)
+    interactive = threading.Thread(target=request, args=('interactive', PRIORITY_INTERACTIVE))
+    interactive.start()
+    background.join()
+    interactive.join()
+    assert served == ['interactive', 'background']
+
+
+def test_retry_after_header():
+    limiter = TgfpNflRateLimiter(default_retry_after=7.0)
+    assert limiter.retry_after_seconds(httpx.Response(429, headers={'Retry-After': '2'})) == 2.0
+    assert limiter.retry_after_seconds(httpx.Response(429)) == 7.0
+    past_date = httpx.Response(429, headers={'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})
+    assert limiter.retry_after_seconds(past_date) == 0.0
+
+
+def test_get_retries_after_429(monkeypatch):
+    responses = [
+        httpx.Response(429, headers={'Retry-After': '0.2'}),
+        httpx.Response(200, json={'ok': True}),
+    ]
+    monkeypatch.setattr(httpx, 'get', lambda url: responses.pop(0))
+    limiter = TgfpNflRateLimiter(rate=100.0, burst=10)
+    start = time.monotonic()
+    response = limiter.get(URL)
+    assert response.status_code == 200
+    assert time.monotonic() - start >= 0.2
+
+
+def test_get_gives_up_after_max_retries(monkeypatch):
+    calls: List[str] = []
+
+    def always_throttled(url):
+        calls.append(url)
+        return httpx.Response(429, headers={'Retry-After': '0'})
+
+    monkeypatch.setattr(httpx, 'get', always_throttled)
+    limiter = TgfpNflRateLimiter(rate=100.0, burst=10, max_retries=2)
+    assert limiter.get(URL).status_code == 429
+    assert len(calls) == 3
+
+
+def test_last_429_still_blocks_host(monkeypatch):
+    monkeypatch.setattr(httpx, 'get',
+                        lambda url: httpx.Response(429, headers={'Retry-After': '0.2'}))
+    limiter = TgfpNflRateLimiter(rate=100.0, burst=10, max_retries=0)
+    assert limiter.get(URL).status_code == 429
+    start = time.monotonic()
+    limiter.acquire(HOST)
+    assert time.monotonic() - start >= 0.15
+
+
+def test_retry_after_longer_than_max_is_returned(monkeypatch):
+    calls: List[str] = []
+
+    def throttled_for_an_hour(url):
+        calls.append(url)
+        return httpx.Response(429, headers={'Retry-After': '3600'})
+
+    monkeypatch.setattr(httpx, 'get', throttled_for_an_hour)
+    limiter = TgfpNflRateLimiter(rate=100.0, burst=10, max_retry_after=0.2)
+    start = time.monotonic()
+    assert limiter.get(URL).status_code == 429
+    assert len(calls) == 1
+    limiter.acquire(HOST)
+    elapsed = time.monotonic() - start
+    assert 0.15 <= elapsed < 1.0
+
+
+def test_retry_keeps_place_in_queue():
+    limiter = TgfpNflRateLimiter(rate=50.0, burst=1)
+    limiter.acquire(HOST)
+    retried_sequence = limiter.next_sequence()
+    limiter.block_host(HOST, 0.3)
+    served: List[str] = []
+
+    def request(name: str, sequence=None):
+        limiter.acquire(HOST, PRIORITY_INTERACTIVE, sequence)
+        served.append(name)
+
+    newer = threading.Thread(target=request, args=('newer',))
+    newer.start()
+    time.sleep(0.05)
+    retried = threading.Thread(target=request, args=('retried', retried_sequence))
+    retried.start()
+    newer.join()
+    retried.join()
+    assert served == ['retried', 'newer']
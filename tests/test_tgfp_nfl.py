@@ -1,11 +1,15 @@
+import json
 import math
 from typing import List
 
+import httpx
+import pytest
+
 from fixtures import (tgfp_nfl_obj,
                       tgfp_nfl_obj_live,
                       tgfp_nfl_obj_live_week_19,
                       tgfp_nfl_obj_live_week_14)
-from tgfp_nfl import TgfpNfl, TgfpNflTeam, TgfpNflGame, TgfpNflOdd
+from tgfp_nfl import TgfpNfl, TgfpNflTeam, TgfpNflGame, TgfpNflOdd, TgfpNflRateLimiter
 
 shutup_pylint = tgfp_nfl_obj
 shutup_pylint2 = tgfp_nfl_obj_live
@@ -82,6 +86,124 @@ def test_extra_info(tgfp_nfl_obj: TgfpNfl):
     assert game_time.startswith('Thu, September 8th at 8:20 PM EDT')
 
 
+def test_game_to_dict(tgfp_nfl_obj: TgfpNfl):
+    game_1: TgfpNflGame = tgfp_nfl_obj.games()[0]
+    game_dict: dict = game_1.to_dict()
+    assert set(game_dict) == set(TgfpNflGame.SERIALIZABLE_FIELDS)
+    assert game_dict['id'] == game_1.id
+    assert game_dict['event_id'] == 401437654
+    assert game_dict['home_team_id'] == game_1.home_team.id
+    assert game_dict['away_team_id'] == game_1.away_team.id
+    assert game_dict['favored_team_id'] == game_1.favored_team.id
+    assert game_dict['spread'] == 2.5
+    assert game_dict['is_pregame'] is True
+    assert game_dict['winning_team_id'] is None
+    assert game_dict['start_time'] == game_1.start_time.isoformat()
+    json.dumps(game_dict)
+
+
+def test_game_to_dict_fields(tgfp_nfl_obj: TgfpNfl):
+    game_1: TgfpNflGame = tgfp_nfl_obj.games()[0]
+    assert game_1.to_dict(['event_id', 'is_final']) == {'event_id': 401437654, 'is_final': False}
+    with pytest.raises(ValueError):
+        game_1.to_dict(['not_a_field'])
+
+
+def test_team_to_dict(tgfp_nfl_obj: TgfpNfl):
+    team_1: TgfpNflTeam = tgfp_nfl_obj.teams()[0]
+    team_dict: dict = team_1.to_dict()
+    assert set(team_dict) == set(TgfpNflTeam.SERIALIZABLE_FIELDS)
+    assert team_dict['full_name'] == 'Arizona Cardinals'
+    assert team_1.to_dict(['short_name']) == {'short_name': 'ari'}
+
+
+def test_week_to_dict(tgfp_nfl_obj: TgfpNfl):
+    week: dict = tgfp_nfl_obj.to_dict()
+    assert week['week_no'] == 1
+    assert week['season_type'] == 2
+    assert len(week['games']) == 16
+    assert len(week['teams']) == 32
+    for game in week['games']:
+        assert game['home_team_id'] in week['teams']
+        assert game['away_team_id'] in week['teams']
+    json.dumps(week)
+
+
+def test_week_to_dict_fields(tgfp_nfl_obj: TgfpNfl):
+    week: dict = tgfp_nfl_obj.to_dict(game_fields=['event_id'])
+    assert week['games'][0] == {'event_id': 401437654}
+    assert week['teams'] == {}
+    week = tgfp_nfl_obj.to_dict(game_fields=['home_team_id'], team_fields=['short_name'])
+    assert len(week['teams']) == 16
+    assert week['teams'][week['games'][0]['home_team_id']] == {'short_name': 'lar'}
+
+
+def test_week_to_dict_rejects_unknown_fields(tgfp_nfl_obj: TgfpNfl):
+    with pytest.raises(ValueError):
+        tgfp_nfl_obj.to_dict(game_fields=['event_id'], team_fields=['bogus'])
+    with pytest.raises(ValueError):
+        tgfp_nfl_obj.to_dict(game_fields=['bogus'])
+
+
+def test_game_to_dict_resolves_teams_once(tgfp_nfl_obj: TgfpNfl, monkeypatch):
+    game_1: TgfpNflGame = tgfp_nfl_obj.games()[0]
+    first: dict = game_1.to_dict()
+    find_teams_calls: List[dict] = []
+    original_find_teams = tgfp_nfl_obj.find_teams
+
+    def counting_find_teams(*args, **kwargs):
+        find_teams_calls.append(kwargs)
+        return original_find_teams(*args, **kwargs)
+
+    monkeypatch.setattr(tgfp_nfl_obj, 'find_teams', counting_find_teams)
+    assert game_1.to_dict() == first
+    assert not find_teams_calls
+
+
+def test_week_to_dict_skips_predictor_requests(tgfp_nfl_obj: TgfpNfl, monkeypatch):
+    requested_urls: List[str] = []
+
+    def recording_get(url):
+        requested_urls.append(url)
+        return httpx.Response(200, json={}, request=httpx.Request('GET', url))
+
+    monkeypatch.setattr(httpx, 'get', recording_get)
+    tgfp_nfl_obj.to_dict(game_fields=['event_id', 'home_team_id', 'spread'])
+    assert not requested_urls
+    tgfp_nfl_obj.to_dict(game_fields=['matchup_quality'])
+    assert len(requested_urls) == 16
+
+
+def test_predictions_fetched_once(tgfp_nfl_obj: TgfpNfl, monkeypatch):
+    with open('data/nfl_game_predictor_data.json', 'r', encoding='utf-8') as predictor_json_data:
+        predictor_data: dict = json.load(predictor_json_data)
+    requested_urls: List[str] = []
+
+    def predictor_get(url):
+        requested_urls.append(url)
+        return httpx.Response(200, json=predictor_data, request=httpx.Request('GET', url))
+
+    monkeypatch.setattr(httpx, 'get', predictor_get)
+    game_1: TgfpNflGame = tgfp_nfl_obj.games()[0]
+    assert math.isclose(game_1.home_team_fpi, -0.4)
+    assert math.isclose(game_1.matchup_quality, 36.0)
+    game_dict: dict = game_1.to_dict(list(TgfpNflGame._PREDICTION_FIELDS))
+    assert game_dict['home_team_fpi'] == game_1.home_team_fpi
+    assert game_dict['away_team_predicted_win_pct'] == game_1.away_team_predicted_win_pct
+    assert len(requested_urls) == 1
+
+
+def test_throttled_schedule_raises_status_error(monkeypatch):
+    def throttled(url):
+        return httpx.Response(429, headers={'Retry-After': '3600'},
+                              request=httpx.Request('GET', url))
+
+    monkeypatch.setattr(httpx, 'get', throttled)
+    tgfp_nfl = TgfpNfl(week_no=1, rate_limiter=TgfpNflRateLimiter(max_retry_after=0))
+    with pytest.raises(httpx.HTTPStatusError):
+        tgfp_nfl.games()
+
+
 def test_api(tgfp_nfl_obj_live: TgfpNfl):
     assert len(tgfp_nfl_obj_live.games()) > 10
     assert len(tgfp_nfl_obj_live.games()) < 20
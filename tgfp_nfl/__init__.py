@@ -1,10 +1,18 @@
 """ TGFP NFL Model Objects """
 
 from .tgfp_nfl import TgfpNfl, TgfpNflOdd, TgfpNflGame, TgfpNflTeam
+from .rate_limiter import (TgfpNflRateLimiter,
+                           PRIORITY_INTERACTIVE,
+                           PRIORITY_BACKGROUND,
+                           shared_rate_limiter)
 
 __all__ = [
     'TgfpNfl',
     'TgfpNflOdd',
     'TgfpNflGame',
-    'TgfpNflTeam'
+    'TgfpNflTeam',
+    'TgfpNflRateLimiter',
+    'PRIORITY_INTERACTIVE',
+    'PRIORITY_BACKGROUND',
+    'shared_rate_limiter'
 ]
@@ -0,0 +1,210 @@
+"""
+  This module contains a per-host token bucket rate limiter that is shared by
+  every TgfpNfl instance so bursts of requests to the data source get paced
+  instead of throttled.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, List, Dict, Tuple
+import heapq
+import itertools
+import threading
+import time
+import httpx
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 10
+
+
+class _TgfpNflTokenBucket:
+    """ Token bucket state for a single host """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens: float = float(burst)
+        self.last_refill: float = time.monotonic()
+        self.blocked_until: float = 0.0
+        self.waiters: List[Tuple[int, int]] = []
+
+    def _refill(self, now: float):
+        elapsed = now - self.last_refill
+        if elapsed > 0:
+            self.tokens = min(float(self.burst), self.tokens + elapsed * self.rate)
+        self.last_refill = now
+
+    def seconds_until_available(self, now: float) -> float:
+        """
+        Returns:
+            how long to wait before a token can be taken, 0 if one is available now
+        """
+        self._refill(now)
+        if self.blocked_until > now:
+            return self.blocked_until - now
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def consume(self):
+        """ Take a single token from the bucket """
+        self.tokens -= 1
+
+
+class TgfpNflRateLimiter:
+    """
+    Paces requests per host with a token bucket.
+
+    Requests waiting on the same host are served lowest priority value first
+    (see PRIORITY_INTERACTIVE / PRIORITY_BACKGROUND) and in arrival order within
+    the same priority.  A 429 response blocks the whole host for the duration
+    given by its 'Retry-After' header (capped at 'max_retry_after') before the
+    request is retried.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    # pylint: disable=too-many-arguments
+    def __init__(self,
+                 rate: float = 5.0,
+                 burst: int = 10,
+                 host_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+                 max_retries: int = 3,
+                 default_retry_after: float = 1.0,
+                 max_retry_after: float = 30.0):
+        """
+        Args:
+            rate: requests per second allowed for hosts without their own limit
+            burst: number of requests that may be sent back to back for those hosts
+            host_limits: {host: (rate, burst)} overrides for specific hosts
+            max_retries: how many times a request that got a 429 is retried
+            default_retry_after: seconds to back off when a 429 has no 'Retry-After'
+            max_retry_after: longest back off honoured; a 429 asking for more blocks the host
+                             for this long and is returned to the caller instead of retried
+        """
+        self._rate = rate
+        self._burst = burst
+        self._host_limits: Dict[str, Tuple[float, int]] = dict(host_limits or {})
+        self._max_retries = max_retries
+        self._default_retry_after = default_retry_after
+        self._max_retry_after = max_retry_after
+        self._buckets: Dict[str, _TgfpNflTokenBucket] = {}
+        self._condition = threading.Condition()
+        self._sequence = itertools.count()
+
+    def configure_host(self, host: str, rate: float, burst: int):
+        """ Set (or replace) the rate and burst size used for a single host """
+        with self._condition:
+            self._host_limits[host] = (rate, burst)
+            bucket = self._buckets.get(host)
+            if bucket:
+                bucket.rate = rate
+                bucket.burst = burst
+                bucket.tokens = min(bucket.tokens, float(burst))
+            self._condition.notify_all()
+
+    def _bucket(self, host: str) -> _TgfpNflTokenBucket:
+        if host not in self._buckets:
+            rate, burst = self._host_limits.get(host, (self._rate, self._burst))
+            self._buckets[host] = _TgfpNflTokenBucket(rate, burst)
+        return self._buckets[host]
+
+    def next_sequence(self) -> int:
+        """ Returns: the arrival order number for a new request """
+        return next(self._sequence)
+
+    def acquire(self,
+                host: str,
+                priority: int = PRIORITY_INTERACTIVE,
+                sequence: Optional[int] = None):
+        """
+        Block until a request to 'host' may be sent
+        Args:
+            sequence: arrival order from 'next_sequence', a retried request passes
+                      its original one to keep its place in the queue
+        """
+        if sequence is None:
+            sequence = self.next_sequence()
+        with self._condition:
+            bucket = self._bucket(host)
+            ticket = (priority, sequence)
+            heapq.heappush(bucket.waiters, ticket)
+            self._condition.notify_all()
+            try:
+                while True:
+                    wait: Optional[float] = None
+                    if bucket.waiters[0] == ticket:
+                        wait = bucket.seconds_until_available(time.monotonic())
+                        if wait <= 0:
+                            heapq.heappop(bucket.waiters)
+                            bucket.consume()
+                            self._condition.notify_all()
+                            return
+                    self._condition.wait(wait)
+            except BaseException:
+                if ticket in bucket.waiters:
+                    bucket.waiters.remove(ticket)
+                    heapq.heapify(bucket.waiters)
+                    self._condition.notify_all()
+                raise
+
+    def block_host(self, host: str, seconds: float):
+        """ Hold back every request to 'host' for the next 'seconds' """
+        with self._condition:
+            bucket = self._bucket(host)
+            bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + seconds)
+            self._condition.notify_all()
+
+    def retry_after_seconds(self, response: httpx.Response) -> float:
+        """
+        Args:
+            response: a 429 response
+        Returns:
+            seconds to wait, from the 'Retry-After' header (delay-seconds or HTTP-date)
+        """
+        retry_after: Optional[str] = response.headers.get('Retry-After')
+        if retry_after is None:
+            return self._default_retry_after
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            retry_at: datetime = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return self._default_retry_after
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def get(self, url: str, priority: int = PRIORITY_INTERACTIVE) -> httpx.Response:
+        """
+        Rate limited 'httpx.get'
+        Returns:
+            the response, which is still a 429 if the retries ran out or the
+            server asked for a back off longer than 'max_retry_after'
+        """
+        host: str = httpx.URL(url).host
+        sequence: int = self.next_sequence()
+        attempt = 0
+        while True:
+            self.acquire(host, priority, sequence)
+            response: httpx.Response = httpx.get(url)
+            if response.status_code != 429:
+                return response
+            retry_after: float = self.retry_after_seconds(response)
+            self.block_host(host, min(retry_after, self._max_retry_after))
+            if attempt >= self._max_retries or retry_after > self._max_retry_after:
+                return response
+            attempt += 1
+
+
+# ESPN does not publish its limits.  The burst covers one cold week load
+# (scoreboard + teams + standings + 16 predictors = 19 requests) so interactive
+# loads are never paced; the 5 req/s refill only slows down bulk backfills.
+shared_rate_limiter = TgfpNflRateLimiter(
+    host_limits={
+        'site.api.espn.com': (5.0, 25),
+        'sports.core.api.espn.com': (5.0, 25),
+    }
+)
@@ -5,18 +5,50 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, List, Dict, Tuple, Iterable
 from urllib.request import Request, urlopen
 import re
 import json
 from dateutil import parser
 import httpx
 
+from .rate_limiter import TgfpNflRateLimiter, PRIORITY_INTERACTIVE, shared_rate_limiter
+
+
+def _selected_fields(fields: Optional[Iterable[str]],
+                     serializable_fields: Tuple[str, ...],
+                     kind: str) -> List[str]:
+    """
+    Returns:
+        'fields' as a list, or all 'serializable_fields' if None
+    Raises:
+        ValueError: if any field is not in 'serializable_fields'
+    """
+    if fields is None:
+        return list(serializable_fields)
+    fields = list(fields)
+    unknown_fields = set(fields) - set(serializable_fields)
+    if unknown_fields:
+        raise ValueError(f'Unknown {kind} fields: {sorted(unknown_fields)}')
+    return fields
+
 
 class TgfpNfl:
     """ The main class for interfacing with Data Source json for sports """
 
-    def __init__(self, week_no, season_type: Optional[int] = None, debug=False):
+    # pylint: disable=too-many-arguments
+    def __init__(self,
+                 week_no,
+                 season_type: Optional[int] = None,
+                 debug=False,
+                 rate_limiter: Optional[TgfpNflRateLimiter] = None,
+                 priority: int = PRIORITY_INTERACTIVE):
+        """
+        Args:
+            rate_limiter: paces requests to the data source, shared by all instances by default
+            priority: PRIORITY_INTERACTIVE for user facing loads,
+                      PRIORITY_BACKGROUND for backfills / bulk refreshes
+        """
         self._games = []
         self._teams = []
         self._standings = []
@@ -29,6 +61,18 @@ class TgfpNfl:
         self._base_url = 'https://site.api.espn.com/apis/v2/sports/football/nfl/'
         self._base_site_url = 'https://site.api.espn.com/apis/site/v2/sports/football/nfl'
         self._base_core_api_url = 'https://sports.core.api.espn.com/v2/sports/football/leagues/nfl/'
+        self._rate_limiter: TgfpNflRateLimiter = rate_limiter or shared_rate_limiter
+        self._priority: int = priority
+
+    def __get(self, url_to_query: str) -> httpx.Response:
+        """ Rate limited GET against the data source
+        :raises httpx.HTTPStatusError: for any non 2xx response, including a 429
+            the rate limiter gave up retrying
+        """
+        response: httpx.Response = self._rate_limiter.get(url_to_query,
+                                                          priority=self._priority)
+        response.raise_for_status()
+        return response
 
     def __get_games_source_data(self) -> List:
         """ Get Games from ESPN -- defaults to current season
@@ -38,7 +82,7 @@ class TgfpNfl:
         week_no = self._week_no - 18 if self._week_no > 18 else self._week_no
         url_to_query = self._base_site_url + f'/scoreboard?seasontype={self.season_type}&week={week_no}'
         try:
-            response = httpx.get(url_to_query)
+            response = self.__get(url_to_query)
             content = response.json()
         except httpx.RequestError:
             print('HTTP Request failed')
@@ -51,7 +95,7 @@ class TgfpNfl:
         content: dict = {}
         url_to_query = self._base_site_url + '/teams'
         try:
-            response = httpx.get(url_to_query)
+            response = self.__get(url_to_query)
             content = response.json()
         except httpx.RequestError:
             print('HTTP Request failed')
@@ -67,7 +111,7 @@ class TgfpNfl:
             season_type = 2
         url_to_query = self._base_url + f'/standings?seasontype={season_type}'
         try:
-            response = httpx.get(url_to_query)
+            response = self.__get(url_to_query)
             content = response.json()
         except httpx.RequestError:
             print('HTTP Request failed')
@@ -76,18 +120,20 @@ class TgfpNfl:
         all_standings: List = afc_standings + nfc_standings
         return all_standings
 
-    def __get_game_predictor_source_data(self, event_id: int) -> List:
+    def game_predictor_source_data(self, event_id: int) -> dict:
         """ Get Game Predictions from ESPN
-        :return: game prediction source data for one game
+        :return: game prediction source data for one game, empty if the request failed
         """
         content: dict = {}
         url_to_query = (self._base_core_api_url +
                         f'events/{event_id}/competitions/{event_id}/predictor')
         try:
-            response = httpx.get(url_to_query)
+            response = self.__get(url_to_query)
             content = response.json()
         except httpx.RequestError:
             print('HTTP Request failed')
+        except httpx.HTTPStatusError as error:
+            print(f'HTTP Request failed with status {error.response.status_code}')
 
         return content
 
@@ -124,14 +170,7 @@ class TgfpNfl:
         if not self._games_source_data:
             self._games_source_data = self.__get_games_source_data()
         for game_data in self._games_source_data:
-            single_game_data = self.__get_game_predictor_source_data(
-                int(game_data['id'])
-            )
-            a_game: TgfpNflGame = TgfpNflGame(
-                self,
-                game_data=game_data,
-                game_prediction_data=single_game_data
-            )
+            a_game: TgfpNflGame = TgfpNflGame(self, game_data=game_data)
             self._games.append(a_game)
 
         return self._games
@@ -171,6 +210,44 @@ class TgfpNfl:
             ))
         return self._standings
 
+    def to_dict(self,
+                game_fields: Optional[Iterable[str]] = None,
+                team_fields: Optional[Iterable[str]] = None) -> dict:
+        """
+        Serialize the whole week in one pass, game predictor data is only requested
+        when a prediction field is selected
+        Args:
+            game_fields: see TgfpNflGame.SERIALIZABLE_FIELDS, all of them if None
+            team_fields: see TgfpNflTeam.SERIALIZABLE_FIELDS, all of them if None
+        Returns:
+            {
+                'week_no': <int>,
+                'season_type': <int>,
+                'games': [<game dict>, ...],
+                'teams': {<team id>: <team dict>, ...}  # only teams referenced by the games
+            }
+        """
+        # pylint: disable=protected-access
+        game_fields = _selected_fields(game_fields, TgfpNflGame.SERIALIZABLE_FIELDS, 'game')
+        team_fields = _selected_fields(team_fields, TgfpNflTeam.SERIALIZABLE_FIELDS, 'team')
+        games: List[dict] = [game._serialize(game_fields) for game in self.games()]
+        team_id_fields = [field for field in game_fields if field in TgfpNflGame.TEAM_ID_FIELDS]
+        referenced_team_ids = {
+            game[field] for game in games for field in team_id_fields if game[field]
+        }
+        teams: Dict[str, dict] = {}
+        if referenced_team_ids:
+            teams = {
+                team.id: team._serialize(team_fields)
+                for team in self.teams() if team.id in referenced_team_ids
+            }
+        return {
+            'week_no': self._week_no,
+            'season_type': self.season_type,
+            'games': games,
+            'teams': teams,
+        }
+
     def find_game(self,
                   nfl_game_id=None,
                   event_id=None) -> Optional[TgfpNflGame]:
@@ -221,7 +298,46 @@ class TgfpNflGame:
 
     # pylint: disable=too-many-instance-attributes
 
-    def __init__(self, data_source: TgfpNfl, game_data, game_prediction_data):
+    # fields that need home / away / favorite teams and the score resolved
+    _TEAM_AND_SCORE_FIELDS = (
+        'home_team_id',
+        'away_team_id',
+        'favored_team_id',
+        'spread',
+        'total_home_points',
+        'total_away_points',
+    )
+    # field name -> (stat name, home team statistics?) in the game predictor data
+    _PREDICTION_FIELDS = {
+        'home_team_predicted_win_pct': ('gameProjection', True),
+        'away_team_predicted_win_pct': ('gameProjection', False),
+        'home_team_fpi': ('oppSeasonStrengthRating', False),
+        'away_team_fpi': ('oppSeasonStrengthRating', True),
+        'home_team_predicted_pt_diff': ('teamPredPtDiff', True),
+        'away_team_predicted_pt_diff': ('teamPredPtDiff', False),
+        'matchup_quality': ('matchupQuality', True),
+    }
+    SERIALIZABLE_FIELDS = (
+        'id',
+        'event_id',
+        'start_time',
+        'game_status_type',
+        'is_pregame',
+        'is_final',
+        'winning_team_id',
+        'extra_info',
+    ) + _TEAM_AND_SCORE_FIELDS + tuple(_PREDICTION_FIELDS)
+    TEAM_ID_FIELDS = ('home_team_id', 'away_team_id', 'favored_team_id', 'winning_team_id')
+
+    def __init__(self,
+                 data_source: TgfpNfl,
+                 game_data,
+                 game_prediction_data: Optional[dict] = None):
+        """
+        Args:
+            game_prediction_data: predictor source data, fetched from 'data_source'
+                                  the first time a prediction is read if None
+        """
         # pylint: disable=invalid-name
         self.id: str = game_data['uid']
         # pylint: enable=invalid-name
@@ -231,7 +347,8 @@ class TgfpNflGame:
         self._odds_source_data: List = []
         if 'odds' in game_data['competitions'][0]:
             self._odds_source_data = game_data['competitions'][0]['odds']
-        self._game_predictor_source_data = game_prediction_data
+        self._game_predictor_source_data: Optional[dict] = game_prediction_data
+        self._prediction_statistics_by_side: Dict[bool, Dict[str, str]] = {}
         self._home_team: Optional[TgfpNflTeam] = None
         self._away_team: Optional[TgfpNflTeam] = None
         self._favored_team: Optional[TgfpNflTeam] = None
@@ -257,19 +374,6 @@ class TgfpNflGame:
             )
         return return_odds
 
-    def _prediction_helper(
-            self,
-            stat_name: str,
-            home_team: bool = True,
-            key: str = 'displayValue'
-    ) -> [str | float]:
-        team = 'homeTeam' if home_team else 'awayTeam'
-        statistics: List = self._game_predictor_source_data[team]['statistics']
-        for stat in statistics:
-            if stat['name'] == stat_name:
-                return stat[key]
-        return "Not Found"
-
     @property
     def favored_team(self) -> Optional[TgfpNflTeam]:
         if self._favored_team:
@@ -308,13 +412,10 @@ class TgfpNflGame:
 
     @property
     def winning_team(self) -> Optional[TgfpNflTeam]:
-        teams: List = self._game_source_data['competitions'][0]['competitors']
         if not self._winning_team:
-            if 'winner' in teams[0]:
-                if teams[0]['winner']:
-                    self._winning_team = self._data_source.find_teams(teams[0]['uid'])[0]
-                else:
-                    self._winning_team = self._data_source.find_teams(teams[1]['uid'])[0]
+            winning_team_id: Optional[str] = self._winning_team_id()
+            if winning_team_id:
+                self._winning_team = self._data_source.find_teams(team_id=winning_team_id)[0]
         return self._winning_team
 
     @property
@@ -334,58 +435,50 @@ class TgfpNflGame:
         return self._total_away_points
 
     @property
-    def home_team_predicted_win_pct(self) -> float:
-        return float(self._prediction_helper('gameProjection'))
+    def home_team_predicted_win_pct(self) -> Optional[float]:
+        return self._prediction_value('home_team_predicted_win_pct')
 
     @property
-    def away_team_predicted_win_pct(self) -> float:
-        return float(self._prediction_helper('gameProjection', home_team=False))
+    def away_team_predicted_win_pct(self) -> Optional[float]:
+        return self._prediction_value('away_team_predicted_win_pct')
 
     @property
-    def home_team_fpi(self) -> float:
-        return float(self._prediction_helper('oppSeasonStrengthRating', home_team=False))
+    def home_team_fpi(self) -> Optional[float]:
+        return self._prediction_value('home_team_fpi')
 
     @property
-    def away_team_fpi(self) -> float:
-        return float(self._prediction_helper('oppSeasonStrengthRating'))
+    def away_team_fpi(self) -> Optional[float]:
+        return self._prediction_value('away_team_fpi')
 
     @property
-    def home_team_predicted_pt_diff(self) -> float:
-        return float(self._prediction_helper('teamPredPtDiff'))
+    def home_team_predicted_pt_diff(self) -> Optional[float]:
+        return self._prediction_value('home_team_predicted_pt_diff')
 
     @property
-    def matchup_quality(self) -> float:
-        return float(self._prediction_helper('matchupQuality'))
+    def matchup_quality(self) -> Optional[float]:
+        return self._prediction_value('matchup_quality')
 
     @property
-    def away_team_predicted_pt_diff(self) -> float:
-        return float(self._prediction_helper('teamPredPtDiff', home_team=False))
+    def away_team_predicted_pt_diff(self) -> Optional[float]:
+        return self._prediction_value('away_team_predicted_pt_diff')
 
     @property
-    def predicted_winning_diff_team(self) -> Tuple[float, TgfpNflTeam]:
+    def predicted_winning_diff_team(self) -> Tuple[Optional[float], TgfpNflTeam]:
         """
         Get the predicted winner of the game, and the point differential
         Returns:
            - (float, TgfpNflTeam) # Point differential (float) winning team
+             the differential is None when there is no prediction
         """
         # get either home or away, it doesn't matter
-        diff: float = self.home_team_predicted_pt_diff
-        if diff > 0:
+        diff: Optional[float] = self.home_team_predicted_pt_diff
+        if diff is not None and diff > 0:
             return diff, self.home_team
         diff = self.away_team_predicted_pt_diff
         return diff, self.away_team
 
     def __set_home_away_favorite_teams_and_score(self):
         teams: List = self._game_source_data['competitions'][0]['competitors']
-        if self._odds():
-            if self._odds().favored_team_short_name is None:
-                self._favored_team = self._home_team
-                self._spread = 0.5
-            else:
-                self._favored_team = self._data_source.find_teams(
-                    short_name=self._odds().favored_team_short_name
-                )[0]
-                self._spread = self._odds().favored_team_spread
         if teams[0]['homeAway'] == 'home':
             self._total_home_points = int(teams[0]['score'])
             self._home_team = self._data_source.find_teams(team_id=teams[0]['uid'])[0]
@@ -396,6 +489,16 @@ class TgfpNflGame:
             self._home_team = self._data_source.find_teams(team_id=teams[1]['uid'])[0]
             self._total_away_points = int(teams[0]['score'])
             self._away_team = self._data_source.find_teams(team_id=teams[0]['uid'])[0]
+        odds: Optional[TgfpNflOdd] = self._odds()
+        if odds:
+            if odds.favored_team_short_name is None:
+                self._favored_team = self._home_team
+                self._spread = 0.5
+            else:
+                self._favored_team = self._data_source.find_teams(
+                    short_name=odds.favored_team_short_name
+                )[0]
+                self._spread = odds.favored_team_spread
 
     @property
     def extra_info(self) -> dict:
@@ -404,12 +507,99 @@ class TgfpNflGame:
             'game_time': self._game_source_data['status']['type']['detail']
         }
 
+    def _prediction_statistics(self, home_team: bool) -> Dict[str, str]:
+        """
+        Returns:
+            {stat name: display value} for one side of the game predictor data
+        """
+        if home_team not in self._prediction_statistics_by_side:
+            if self._game_predictor_source_data is None:
+                self._game_predictor_source_data = \
+                    self._data_source.game_predictor_source_data(self.event_id)
+            team = 'homeTeam' if home_team else 'awayTeam'
+            statistics: List = \
+                self._game_predictor_source_data.get(team, {}).get('statistics', [])
+            self._prediction_statistics_by_side[home_team] = {
+                stat['name']: stat['displayValue'] for stat in statistics
+            }
+        return self._prediction_statistics_by_side[home_team]
+
+    def _prediction_value(self, field: str) -> Optional[float]:
+        """
+        Args:
+            field: one of _PREDICTION_FIELDS
+        Returns:
+            the predicted value, None if the predictor data doesn't have it
+        """
+        stat_name, home_team = self._PREDICTION_FIELDS[field]
+        value: Optional[str] = self._prediction_statistics(home_team).get(stat_name)
+        return float(value) if value is not None else None
+
+    def _winning_team_id(self) -> Optional[str]:
+        """ Returns: the uid of the winning team, None if the game has no winner yet """
+        teams: List = self._game_source_data['competitions'][0]['competitors']
+        if 'winner' not in teams[0]:
+            return None
+        return teams[0]['uid'] if teams[0]['winner'] else teams[1]['uid']
+
+    def to_dict(self, fields: Optional[Iterable[str]] = None) -> dict:
+        """
+        Serialize the game, computing each derived value only once.
+        Teams are referenced by id, see TgfpNfl.to_dict for the shared team table.
+        The predictor data is only requested when a prediction field is selected.
+        Args:
+            fields: names from SERIALIZABLE_FIELDS to include, all of them if None
+        Returns:
+            dict of the selected fields, prediction values are None when not available
+        """
+        return self._serialize(_selected_fields(fields, self.SERIALIZABLE_FIELDS, 'game'))
+
+    def _serialize(self, fields: List[str]) -> dict:
+        """ to_dict without validating 'fields' """
+        if self._home_team is None and \
+                any(field in self._TEAM_AND_SCORE_FIELDS for field in fields):
+            self.__set_home_away_favorite_teams_and_score()
+        game_dict: dict = {}
+        for field in fields:
+            if field in self._PREDICTION_FIELDS:
+                game_dict[field] = self._prediction_value(field)
+            elif field == 'start_time':
+                game_dict[field] = self.start_time.isoformat()
+            elif field == 'winning_team_id':
+                game_dict[field] = self._winning_team_id()
+            elif field == 'home_team_id':
+                game_dict[field] = self._home_team.id
+            elif field == 'away_team_id':
+                game_dict[field] = self._away_team.id
+            elif field == 'favored_team_id':
+                game_dict[field] = self._favored_team.id if self._favored_team else None
+            elif field in ('spread', 'total_home_points', 'total_away_points'):
+                game_dict[field] = getattr(self, '_' + field)
+            else:
+                game_dict[field] = getattr(self, field)
+        return game_dict
+
 
 class TgfpNflTeam:
     """ The class that wraps the Data Source JSON for each team """
 
     # pylint: disable=too-many-instance-attributes
     # pylint: disable=too-few-public-methods
+
+    SERIALIZABLE_FIELDS = (
+        'id',
+        'city',
+        'long_name',
+        'short_name',
+        'full_name',
+        'logo_url',
+        'color',
+        'alternate_color',
+        'wins',
+        'losses',
+        'ties',
+    )
+
     def __init__(self, team_data: Dict, team_standings: TgfpNflStanding):
         self.data = team_data
         self.id = team_data['uid']
@@ -424,6 +614,19 @@ class TgfpNflTeam:
         self.losses = team_standings.losses
         self.ties = team_standings.ties
 
+    def to_dict(self, fields: Optional[Iterable[str]] = None) -> dict:
+        """
+        Args:
+            fields: names from SERIALIZABLE_FIELDS to include, all of them if None
+        Returns:
+            dict of the selected fields
+        """
+        return self._serialize(_selected_fields(fields, self.SERIALIZABLE_FIELDS, 'team'))
+
+    def _serialize(self, fields: List[str]) -> dict:
+        """ to_dict without validating 'fields' """
+        return {field: getattr(self, field) for field in fields}
+
     def tgfp_id(self, tgfp_teams):
         """
         Args: